@@ -75,6 +75,8 @@ class Config:
         'IFCN',
     ]
     pan_ammount: int = 10
+    # Rasterize the plot with OpenGL (falls back to software if unavailable)
+    use_opengl: bool = False
 
 
 config = Config()
@@ -18,12 +18,16 @@
 from pathlib import Path
 from typing import Union, Tuple, Optional, Dict
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
+import threading
 
 import mne
 import numpy as np
+from scipy.signal import butter, sosfiltfilt
 
-from src.core.montage_manager import montage_manager
+from src.core.montage_manager import get_montage_manager, Montage
 
 
 logger = logging.getLogger(__name__)
@@ -38,20 +42,34 @@ class EEGDataStreamer:
     Key improvements over full preload:
     - 100MB file: ~30-50MB RAM (vs 400-500MB with full preload)
     - Only loads visible time windows (6-10 seconds)
-    - Caches up to 5 recent windows for smooth navigation
+    - Caches up to 7 recent windows for smooth navigation
+    - Prefetches the adjacent windows on a background thread
     - Applies montage/filter transformations on small windows only
     """
 
-    MAX_CACHE_SIZE = 5  # Maximum number of windows to cache
+    MAX_CACHE_SIZE = 7  # Maximum number of windows to cache (current + prefetched neighbours)
+    WINDOW_LEAD_SECONDS = 0.01  # Loaded before the window start to cover cache-key rounding (see _window_key)
+    FILTER_ORDER = 4  # Butterworth order (applied forward and backward)
+    READAHEAD_MAX_BYTES = 512 * 1024 * 1024  # Page-cache warm-up limit on open
 
     def __init__(self):
         self.raw_handle: Optional[mne.io.Raw] = None
-        self.window_cache: OrderedDict = OrderedDict()
+        self.window_cache: OrderedDict = OrderedDict()  # montage/filter-transformed windows
+        self.raw_window_cache: OrderedDict = OrderedDict()  # (first sample, samples) keyed by (tmin, tmax)
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0  # Bumped on invalidation so in-flight prefetches are dropped
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eeg-prefetch")
+        self._prefetch_futures: list = []  # Queued/running prefetches from the last get_window
         self.metadata: Dict = {}
         self.filename: Optional[Path] = None
         self.current_montage: Optional[str] = None
         self.current_filter: Tuple[Optional[float], Optional[float]] = (None, None)
         self._monopolar_type: Optional[str] = None
+        # Per-montage (info, anode_idx, cathode_idx) resolved against the open file
+        # (cathode_idx is None for monopolar montages)
+        self._derivations: Dict[str, Tuple[mne.Info, np.ndarray, Optional[np.ndarray]]] = {}
+        # Butterworth SOS coefficients keyed by (sfreq, low, high)
+        self._filter_sos: Dict[Tuple[float, Optional[float], Optional[float]], np.ndarray] = {}
 
     def open_edf(self, filename: Union[str, Path]) -> None:
         """Open EDF file handle without loading data into memory.
@@ -63,29 +81,45 @@ class EEGDataStreamer:
             FileNotFoundError: If file doesn't exist
             RuntimeError: If file cannot be opened by MNE
         """
-        self.filename = Path(filename)
+        path = Path(filename)
 
-        if not self.filename.exists():
+        if not path.exists():
             raise FileNotFoundError(f"EDF file not found: {filename}")
 
+        # Let in-flight prefetches of the previous file finish before swapping handles
+        self._stop_prefetch()
+
         try:
             # CRITICAL: preload=False keeps file on disk, only loads metadata
-            self.raw_handle = mne.io.read_raw_edf(filename, preload=False, verbose=False)
+            self.raw_handle = mne.io.read_raw_edf(path, preload=False, verbose=False)
+            # Only set once the file is open: callers reuse the handle when filename matches
+            self.filename = path
+
+            # Let the OS start reading the file so the first windows hit warm pages
+            self._advise_readahead()
 
             # Store metadata only (minimal memory footprint)
             self.metadata = {
                 'sfreq': self.raw_handle.info['sfreq'],
-                'duration': self.raw_handle.times[-1],
+                # Last sample time from n_times (Raw.times would allocate an array of every sample time)
+                'duration': (self.raw_handle.n_times - 1) / self.raw_handle.info['sfreq'],
                 'n_channels': len(self.raw_handle.ch_names),
                 'ch_names': self.raw_handle.ch_names.copy(),
             }
 
-            # Clear cache when opening new file
-            self.window_cache.clear()
+            # Montage derivations are resolved per file
+            self._derivations.clear()
 
             # Cache monopolar type (static per file, avoids regex on every window load)
             eeg_channels = [ch for ch in self.metadata['ch_names'] if ch.startswith('EEG')]
-            self._monopolar_type = montage_manager.get_monopolar_type(eeg_channels)
+            self._monopolar_type = get_montage_manager().get_monopolar_type(eeg_channels)
+
+            # Resolve every montage once so window loads skip Info construction
+            for montage in get_montage_manager().montages.values():
+                try:
+                    self._get_derivation(montage)
+                except (KeyError, ValueError) as e:
+                    logger.debug(f"Montage {montage.name} unavailable for this file: {e}")
 
             logger.info(
                 f"Opened EDF: {filename} "
@@ -94,15 +128,40 @@ class EEGDataStreamer:
             )
 
         except Exception as e:
+            # Do not leave the previous file's handle behind under any name
+            self.raw_handle = None
+            self.filename = None
+            self.metadata = {}
             raise RuntimeError(f"Failed to open EDF file {filename}: {e}")
 
+    def _advise_readahead(self) -> None:
+        """Ask the kernel to read the file into the page cache in the background.
+
+        Uses posix_fadvise(WILLNEED), which returns immediately; a no-op on
+        platforms without it (e.g. Windows). Failures are not fatal.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+
+        try:
+            fd = os.open(self.filename, os.O_RDONLY)
+            try:
+                length = min(os.fstat(fd).st_size, self.READAHEAD_MAX_BYTES)
+                os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug(f"Readahead advice failed for {self.filename}: {e}")
+
     def get_window(
         self,
         start_time: float,
         duration: float,
         montage_name: str,
         filter_params: Tuple[Optional[float], Optional[float]],
-        buffer_seconds: float = 2.0
+        buffer_seconds: float = 2.0,
+        prefetch: bool = True,
+        prefetch_step: Optional[float] = None
     ) -> mne.io.Raw:
         """Load and return a small time window of EEG data.
 
@@ -116,9 +175,13 @@ class EEGDataStreamer:
             montage: Montage type (e.g., 'AVERAGE', 'BIPOLAR DOUBLE BANANA')
             filter_params: Tuple of (low_freq, high_freq) for filtering
             buffer_seconds: Extra seconds to load beyond window for smooth panning
+            prefetch: Also load the adjacent windows in the background
+            prefetch_step: Extra neighbour distance to prefetch in seconds
+                (e.g. the pan step); windows one duration away are always prefetched
 
         Returns:
             MNE Raw object containing only the requested time window
+            (its first_time is the window start in recording time)
 
         Raises:
             RuntimeError: If no file is open or window cannot be loaded
@@ -126,115 +189,327 @@ class EEGDataStreamer:
         if self.raw_handle is None:
             raise RuntimeError("No EDF file is open. Call open_edf() first.")
 
-        # Create cache key for this exact window configuration
-        cache_key = (start_time, duration, montage_name, tuple(filter_params))
+        # Create cache key for this window configuration
+        cache_key = self._window_key(start_time, duration, montage_name, filter_params)
 
         # Return cached window if available
-        if cache_key in self.window_cache:
-            # Move to end (most recently used)
-            self.window_cache.move_to_end(cache_key)
-            logger.debug(f"Cache hit for window at {start_time}s")
-            return self.window_cache[cache_key]
+        with self._cache_lock:
+            window_data = self.window_cache.get(cache_key)
+            if window_data is not None:
+                # Move to end (most recently used)
+                self.window_cache.move_to_end(cache_key)
+                logger.debug(f"Cache hit for window at {start_time}s")
+
+        if window_data is None:
+            generation = self._cache_generation
+            try:
+                window_data = self._load_window(
+                    start_time, duration, montage_name, filter_params, buffer_seconds, generation
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to load window at {start_time}s: {e}")
+            self._store_window(self.window_cache, cache_key, window_data, generation)
 
-        # Calculate window boundaries with buffer
-        tmin = max(0, start_time)
-        tmax = min(self.metadata['duration'], start_time + duration + buffer_seconds)
+        if prefetch:
+            self._schedule_prefetch(
+                start_time, duration, montage_name, filter_params, buffer_seconds, prefetch_step
+            )
 
-        logger.debug(f"Loading window: {tmin:.2f}s to {tmax:.2f}s")
+        return window_data
 
-        try:
-            # Load ONLY this time window from disk
-            window_data = self.raw_handle.copy().crop(tmin=tmin, tmax=tmax)
-            window_data.load_data()  # Load only this small window into memory
+    def has_window(
+        self,
+        start_time: float,
+        duration: float,
+        montage_name: str,
+        filter_params: Tuple[Optional[float], Optional[float]]
+    ) -> bool:
+        """Return True if get_window would be served from the cache for these arguments."""
+        cache_key = self._window_key(start_time, duration, montage_name, filter_params)
+        with self._cache_lock:
+            return cache_key in self.window_cache
+
+    def prefetch_around(
+        self,
+        start_time: float,
+        duration: float,
+        montage_name: str,
+        filter_params: Tuple[Optional[float], Optional[float]],
+        buffer_seconds: float = 2.0,
+        prefetch_step: Optional[float] = None
+    ) -> None:
+        """Prefetch the neighbours of a window loaded with get_window(prefetch=False)."""
+        if self.raw_handle is None:
+            return
+        self._schedule_prefetch(
+            start_time, duration, montage_name, filter_params, buffer_seconds, prefetch_step
+        )
 
-            # Apply montage transformation on small window
-            window_data = self._apply_montage(window_data, montage_name)
+    def _load_window(
+        self,
+        start_time: float,
+        duration: float,
+        montage_name: str,
+        filter_params: Tuple[Optional[float], Optional[float]],
+        buffer_seconds: float,
+        generation: int
+    ) -> mne.io.Raw:
+        """Build a montage/filter view of a window from the raw window cache."""
+        # Calculate window boundaries with buffer (rounded to the ms so that
+        # float noise from view ranges does not defeat the raw window cache)
+        tmin = round(max(0, start_time - self.WINDOW_LEAD_SECONDS), 3)
+        tmax = min(self.metadata['duration'], round(start_time + duration + buffer_seconds, 3))
+
+        raw_key = (tmin, tmax)
+        with self._cache_lock:
+            raw_window = self.raw_window_cache.get(raw_key)
+            if raw_window is not None:
+                self.raw_window_cache.move_to_end(raw_key)
+
+        if raw_window is None:
+            logger.debug(f"Loading window: {tmin:.2f}s to {tmax:.2f}s")
+
+            # Read ONLY this time window from disk, straight into an array
+            # (same sample range as Raw.crop(tmin, tmax) without copying the Raw)
+            sfreq = self.metadata['sfreq']
+            first_sample = int(round(tmin * sfreq))
+            last_sample = min(self.raw_handle.n_times, int(round(tmax * sfreq)) + 1)
+            samples = self.raw_handle.get_data(start=first_sample, stop=last_sample)
+            raw_window = (first_sample, samples)
+            self._store_window(self.raw_window_cache, raw_key, raw_window, generation)
+
+        first_sample, samples = raw_window
+
+        # Apply montage transformation on small window (always returns a new array)
+        data, info = self._apply_montage(samples, montage_name)
+
+        # Apply filter on small window
+        data = self._apply_filter(data, info['sfreq'], filter_params)
+
+        # copy=None: data is already a fresh float64 array, and the derivation's Info is
+        # shared by every window of the montage (read-only) instead of deep-copied per window
+        return mne.io.RawArray(data, info, first_samp=first_sample, copy=None, verbose=False)
+
+    @staticmethod
+    def _window_key(
+        start_time: float,
+        duration: float,
+        montage_name: str,
+        filter_params: Tuple[Optional[float], Optional[float]]
+    ) -> Tuple:
+        """Cache key for a transformed window.
 
-            # Apply filter on small window
-            window_data = self._apply_filter(window_data, filter_params)
+        Times are rounded to 10 ms so that returning to a view (pan back, drag
+        jitter) hits the cache. A hit can be for a start up to 5 ms later than
+        requested, which the WINDOW_LEAD_SECONDS loaded before the start covers;
+        the end is covered by the 2 s buffer.
+        """
+        return (round(start_time, 2), round(duration, 2), montage_name, tuple(filter_params))
+
+    def _store_window(self, cache: OrderedDict, cache_key: Tuple, window_data, generation: int) -> None:
+        """Insert a window into an LRU cache unless the cache was invalidated meanwhile."""
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
 
-            # Cache with LRU eviction
-            self.window_cache[cache_key] = window_data
+            cache[cache_key] = window_data
 
             # Evict oldest window if cache exceeds limit
-            if len(self.window_cache) > self.MAX_CACHE_SIZE:
-                removed_key = next(iter(self.window_cache))
-                del self.window_cache[removed_key]
+            if len(cache) > self.MAX_CACHE_SIZE:
+                cache.popitem(last=False)
                 logger.debug(f"Evicted window from cache (size: {self.MAX_CACHE_SIZE})")
 
-            return window_data
+    def _schedule_prefetch(
+        self,
+        start_time: float,
+        duration: float,
+        montage_name: str,
+        filter_params: Tuple[Optional[float], Optional[float]],
+        buffer_seconds: float,
+        prefetch_step: Optional[float] = None
+    ) -> None:
+        """Warm the cache with the previous and next windows in the background.
+
+        Navigation is mostly sequential, so loading the neighbours while the user
+        looks at the current window turns the next pan into a cache hit.
+        Prefetches still queued for an earlier position are cancelled first.
+        """
+        self.cancel_prefetch()
+
+        steps = [duration]
+        if prefetch_step and prefetch_step != duration:
+            steps.append(prefetch_step)
+
+        generation = self._cache_generation
+        for step in steps:
+            for neighbour_start in (start_time + step, start_time - step):
+                if 0 <= neighbour_start < self.metadata['duration']:
+                    self._prefetch_futures.append(self._prefetch_executor.submit(
+                        self._prefetch_window,
+                        neighbour_start, duration, montage_name, filter_params, buffer_seconds, generation
+                    ))
+
+    def cancel_prefetch(self) -> None:
+        """Drop prefetches that have not started yet (e.g. after a jump elsewhere)."""
+        for future in self._prefetch_futures:
+            future.cancel()
+        self._prefetch_futures.clear()
+
+    def _prefetch_window(
+        self,
+        start_time: float,
+        duration: float,
+        montage_name: str,
+        filter_params: Tuple[Optional[float], Optional[float]],
+        buffer_seconds: float,
+        generation: int
+    ) -> None:
+        """Load a single window on the prefetch thread (errors are not fatal)."""
+        cache_key = self._window_key(start_time, duration, montage_name, filter_params)
+        with self._cache_lock:
+            if generation != self._cache_generation or cache_key in self.window_cache:
+                return
 
+        try:
+            window_data = self._load_window(
+                start_time, duration, montage_name, filter_params, buffer_seconds, generation
+            )
         except Exception as e:
-            raise RuntimeError(f"Failed to load window at {start_time}s: {e}")
+            logger.debug(f"Prefetch failed for window at {start_time}s: {e}")
+            return
+
+        self._store_window(self.window_cache, cache_key, window_data, generation)
 
-    def _apply_montage(self, raw: mne.io.Raw, montage_name: str) -> mne.io.Raw:
-        """Apply montage transformation to raw data.
+    def _apply_montage(self, data: np.ndarray, montage_name: str) -> Tuple[np.ndarray, mne.Info]:
+        """Apply montage transformation to a window of file channels.
+
+        The input is never modified; the returned array is always a new one.
 
         Args:
-            raw: MNE Raw object
+            data: Window samples, one row per file channel
             montage: Montage type
 
         Returns:
-            Transformed Raw object with montage applied
+            Tuple of (montage channel samples, montage channel Info)
         """
-        montage = montage_manager.get_montage(montage_name)
-        if montage.type == 'monopolar':
-            try:
-                electrodes = [channels[0] for channels in montage.configuration.values()]
-                raw.pick(electrodes)
-                raw.rename_channels({channels[0]: ch_name for ch_name, channels in montage.configuration.items()})
-            except Exception as e:
-                logger.exception(f"Montage configuration error: {e}")
-                # Return unmodified if montage fails
-        elif montage.type == 'bipolar':
-            try:
-                if self._monopolar_type:
-                    ch_name, anode, cathode = [], [], []
-                    for conf_ch_name, conf_monopolar_types in montage.configuration.items():
-                        ch_name.append(conf_ch_name)
-                        anode.append(conf_monopolar_types[self._monopolar_type][0])
-                        cathode.append(conf_monopolar_types[self._monopolar_type][1])
-                    raw = mne.set_bipolar_reference(
-                        raw,
-                        anode=anode,
-                        cathode=cathode,
-                        ch_name=ch_name,
-                        drop_refs=True,
-                        copy=False,  # Modify in-place to save memory
-                        verbose=False,
-                    )
-                    raw.pick(ch_name)
+        montage = get_montage_manager().get_montage(montage_name)
+        try:
+            info, anode_idx, cathode_idx = self._get_derivation(montage)
+        except Exception as e:
+            logger.exception(f"Montage configuration error: {e}")
+            # Return unmodified if montage fails
+            return data.copy(), self.raw_handle.info
 
-            except Exception as e:
-                logger.exception(f"Montage configuration error: {e}")
-                # Return unmodified if montage fails
-        return raw
+        # Gather anodes, then subtract cathodes in place (one temporary fewer than a - b)
+        derived = data[anode_idx]
+        if cathode_idx is not None:
+            np.subtract(derived, data[cathode_idx], out=derived)
+        return derived, info
+
+    def _get_derivation(self, montage: Montage) -> Tuple[mne.Info, np.ndarray, Optional[np.ndarray]]:
+        """Resolve a montage against the open file.
+
+        The derived channel Info and the electrode indices depend only on the
+        file's channel list and the montage, so they are computed once per
+        montage and reused for every window.
+
+        Args:
+            montage: Monopolar or bipolar montage
+
+        Returns:
+            Tuple of (derived channel Info, anode indices, cathode indices or
+            None for monopolar montages)
+
+        Raises:
+            KeyError: If an electrode referenced by the montage is not in the file
+            ValueError: If a bipolar montage is requested for a file whose
+                monopolar type is unknown
+        """
+        if montage.name not in self._derivations:
+            bipolar = montage.type == 'bipolar'
+            if bipolar and not self._monopolar_type:
+                raise ValueError("Unknown monopolar type, cannot derive bipolar channels")
+
+            ch_index = {name: i for i, name in enumerate(self.metadata['ch_names'])}
+            ch_names, anode_idx, cathode_idx = [], [], []
+            for conf_ch_name, conf_channels in montage.configuration.items():
+                ch_names.append(conf_ch_name)
+                if bipolar:
+                    anode, cathode = conf_channels[self._monopolar_type]
+                    anode_idx.append(ch_index[anode])
+                    cathode_idx.append(ch_index[cathode])
+                else:
+                    anode_idx.append(ch_index[conf_channels[0]])
+            info = mne.create_info(ch_names, self.metadata['sfreq'], ch_types='eeg')
+            self._derivations[montage.name] = (
+                info, np.array(anode_idx), np.array(cathode_idx) if bipolar else None
+            )
+
+        return self._derivations[montage.name]
 
     def _apply_filter(
         self,
-        raw: mne.io.Raw,
+        data: np.ndarray,
+        sfreq: float,
         filter_params: Tuple[Optional[float], Optional[float]]
-    ) -> mne.io.Raw:
-        """Apply frequency filter to raw data.
+    ) -> np.ndarray:
+        """Apply frequency filter to window samples.
+
+        Uses a zero-phase Butterworth filter (SOS form) whose coefficients are
+        designed once per (sfreq, low, high) and reused for every window.
 
         Args:
-            raw: MNE Raw object
+            data: Window samples, one row per channel
+            sfreq: Sampling frequency in Hz
             filter_params: Tuple of (low_freq, high_freq)
 
         Returns:
-            Filtered Raw object
+            Filtered samples
         """
         l_freq, h_freq = filter_params
 
         # Only filter if at least one frequency is specified
         if l_freq is not None or h_freq is not None:
             try:
-                raw.filter(l_freq=l_freq, h_freq=h_freq, verbose=False)
+                sos = self._get_filter_sos(sfreq, l_freq, h_freq)
+                data = sosfiltfilt(sos, data, axis=-1)
             except Exception as e:
                 logger.warning(f"Filter failed ({l_freq}, {h_freq}Hz): {e}")
                 # Return unfiltered if filter fails
 
-        return raw
+        return data
+
+    def _get_filter_sos(
+        self,
+        sfreq: float,
+        l_freq: Optional[float],
+        h_freq: Optional[float]
+    ) -> np.ndarray:
+        """Get (cached) Butterworth second-order sections for a filter setting.
+
+        Follows MNE's conventions: low only is a high-pass, high only is a
+        low-pass, low < high is a band-pass and low > high is a band-stop.
+
+        Raises:
+            ValueError: If the cutoffs are invalid for this sampling frequency
+        """
+        key = (sfreq, l_freq, h_freq)
+        sos = self._filter_sos.get(key)
+        if sos is None:
+            if l_freq is not None and h_freq is not None:
+                if l_freq < h_freq:
+                    cutoff, btype = [l_freq, h_freq], 'bandpass'
+                else:
+                    cutoff, btype = [h_freq, l_freq], 'bandstop'
+            elif l_freq is not None:
+                cutoff, btype = l_freq, 'highpass'
+            else:
+                cutoff, btype = h_freq, 'lowpass'
+
+            sos = butter(self.FILTER_ORDER, cutoff, btype=btype, fs=sfreq, output='sos')
+            self._filter_sos[key] = sos
+
+        return sos
 
     def get_metadata(self) -> Dict:
         """Get file metadata without loading data.
@@ -259,16 +534,34 @@ class EEGDataStreamer:
         return self.metadata.get('ch_names', []).copy()
 
     def clear_cache(self) -> None:
-        """Clear all cached windows (e.g., when montage/filter changes)."""
-        self.window_cache.clear()
+        """Clear transformed windows (e.g., when montage/filter changes).
+
+        Raw windows read from disk stay cached, so the new settings are applied
+        without touching the file again.
+        """
+        self._invalidate_cache()
         logger.debug("Cleared window cache")
 
+    def _invalidate_cache(self, include_raw: bool = False) -> None:
+        """Drop cached windows and discard results of prefetches still in flight."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self.window_cache.clear()
+            if include_raw:
+                self.raw_window_cache.clear()
+
+    def _stop_prefetch(self) -> None:
+        """Drop all cached windows, invalidate queued prefetches and wait for the one in progress."""
+        self._invalidate_cache(include_raw=True)
+        self._prefetch_executor.submit(lambda: None).result()
+
     def close(self) -> None:
         """Close file handle and free resources."""
+        self._stop_prefetch()
         if self.raw_handle is not None:
             self.raw_handle.close()
             self.raw_handle = None
 
-        self.window_cache.clear()
+        self._derivations.clear()
         self.metadata.clear()
         logger.info("Closed EDF file")
@@ -23,6 +23,12 @@ import yaml
 
 from src.utils.path_utils import resource_path
 
+# Prefer the libyaml C loader (much faster at startup); fall back to pure Python
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
+
 
 @dataclass
 class Montage:
@@ -38,33 +44,34 @@ class MontageManager:
         self.montages = {}
 
         for montage_type_entry in os.scandir(self.montages_path):
-            if montage_type_entry.is_dir():
-                for montage_name_entry in os.scandir(montage_type_entry.path):
-                    if montage_name_entry.name.endswith('.yaml'):
-                        montage_type = montage_type_entry.name
-                        montage_name = montage_name_entry.name.replace('.yaml', '').replace('_', ' ').upper()
-                        self.montages[montage_name] = self._load_montage(montage_type, montage_name)
+            if not montage_type_entry.is_dir():
+                continue
+            for montage_name_entry in os.scandir(montage_type_entry.path):
+                if not montage_name_entry.is_file() or not montage_name_entry.name.endswith('.yaml'):
+                    continue
+                montage_name = montage_name_entry.name[:-len('.yaml')].replace('_', ' ').upper()
+                self.montages[montage_name] = self._load_montage(
+                    montage_type_entry.name, montage_name, montage_name_entry.path
+                )
 
         self.channel_patterns = {
             'REF': re.compile(r"^EEG .+-A\d{1,2}$"),
             'AV': re.compile(r"^EEG .+-AV$"),
         }
 
-    def _load_montage(self, montage_type: str, montage_name: str) -> Montage:
+    def _load_montage(self, montage_type: str, montage_name: str, montage_path: str) -> Montage:
         """Load montage configuration from YAML file.
 
         Args:
             montage_type: Type of montage (e.g., 'bipolar')
-            montage_name: Name of montage (e.g., 'BIPOLAR_DOUBLE_BANANA')
+            montage_name: Name of montage (e.g., 'BIPOLAR DOUBLE BANANA')
+            montage_path: Absolute path to the montage YAML file
 
         Returns:
             Montage object
         """
-        montage_filename = montage_name.replace(' ', '_').lower() + '.yaml'
-        montage_path = os.path.join(self.montages_path, montage_type, montage_filename)
-
         with open(montage_path, 'r') as file:
-            configuration = yaml.safe_load(file)
+            configuration = yaml.load(file, Loader=_YamlLoader)
 
         return Montage(montage_type, montage_name, configuration)
 
@@ -91,5 +98,14 @@ class MontageManager:
                 return pattern_type
         return None
 
-# Global singleton instance
-montage_manager = MontageManager()
+# Global singleton instance, built on first use so importing this module stays
+# free of filesystem and YAML work
+_montage_manager: MontageManager | None = None
+
+
+def get_montage_manager() -> MontageManager:
+    """Return the shared MontageManager, loading the montage YAMLs on first call."""
+    global _montage_manager
+    if _montage_manager is None:
+        _montage_manager = MontageManager()
+    return _montage_manager
@@ -37,6 +37,7 @@ class AppState(QObject):
     def __init__(self):
         super().__init__()
         self._montage_name = 'AVERAGE'
+        self._montage_slug = 'AVERAGE'
         self._filter = (None, None)
         self._montage_list = []
         self._scale = 0
@@ -53,12 +54,18 @@ class AppState(QObject):
     def set_montage(self, montage_name):
         if montage_name != self._montage_name:
             self._montage_name = montage_name
+            self._montage_slug = montage_name.replace(' ', '_')
             self.montage_changed.emit()
     
     @property
     def montage_name(self) -> str:
         return self._montage_name
 
+    @property
+    def montage_slug(self) -> str:
+        """Montage name as used in annotation file names (spaces become underscores)."""
+        return self._montage_slug
+
     def set_filter(self, filter):
         if filter != self._filter:
             self._filter = filter
@@ -15,7 +15,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QIntValidator, QDoubleValidator
 from PyQt6.QtWidgets import (
     QToolBar,
@@ -24,17 +24,32 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QComboBox,
-    QVBoxLayout,
-    QHBoxLayout,
+    QGridLayout,
     QWidget,
 )
 
 from src.utils.path_utils import resource_path
-from src.core.montage_manager import montage_manager
+from src.core.montage_manager import get_montage_manager
 from src.core.config import config
 from src.models.app_state import AppState
 
 
+# Display scales offered in the scale combo box (µV/mm)
+_SCALES = (1, 2, 5, 7, 10, 15, 20, 50, 70, 100, 200, 500, 1000)
+
+# Decoded toolbar icons, shared by every toolbar instance
+_ICON_CACHE: dict[str, QIcon] = {}
+
+
+def _icon(name: str) -> QIcon:
+    """Return the icon resources/icons/<name>, decoding it only once."""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = QIcon(resource_path(f"resources/icons/{name}", to_string=True))
+        _ICON_CACHE[name] = icon
+    return icon
+
+
 class ControlToolBar(QToolBar):
     """Toolbar for controlling EEG display and annotation operations."""
 
@@ -45,30 +60,33 @@ class ControlToolBar(QToolBar):
         super().__init__()
         self.state = state
 
+        # Initial values are pushed into the state silently: no file is loaded yet
+        signals_were_blocked = self.state.blockSignals(True)
+
         # Montage selection
         self.select_montage = QComboBox()
-        self.select_montage.addItems(sorted(montage_manager.montages.keys()))
+        self.select_montage.addItems(sorted(get_montage_manager().montages.keys()))
         self.select_montage.currentTextChanged.connect(self.on_montage_changed)
 
         # File operations
         self.open_file = QPushButton("Open")
-        self.open_file.setIcon(QIcon(resource_path("resources/icons/folder.png", to_string=True)))
+        self.open_file.setIcon(_icon("folder.png"))
         self.open_file.clicked.connect(self.on_open_clicked)
 
         self.save_btn = QPushButton("Save Annotation")
-        self.save_btn.setIcon(QIcon(resource_path("resources/icons/diskette.png", to_string=True)))
+        self.save_btn.setIcon(_icon("diskette.png"))
         self.save_btn.clicked.connect(self.on_save_clicked)
         self.save_btn.setEnabled(False)
 
         # Undo button
         self.undo_btn = QPushButton("Undo")
-        self.undo_btn.setIcon(QIcon(resource_path("resources/icons/undo.png", to_string=True)))
+        self.undo_btn.setIcon(_icon("undo.png"))
         self.undo_btn.setEnabled(False)
         self.undo_btn.clicked.connect(self.on_undo_clicked)
 
         # Label/annotate button
         self.label_btn = QPushButton("Label")
-        self.label_btn.setIcon(QIcon(resource_path("resources/icons/add-selection.png", to_string=True)))
+        self.label_btn.setIcon(_icon("add-selection.png"))
         self.label_btn.setEnabled(False)
         self.label_btn.setCheckable(True)
         self.label_btn.clicked.connect(self.on_label_clicked)
@@ -92,15 +110,23 @@ class ControlToolBar(QToolBar):
         self.high_filter.setValidator(double_validator)
 
         self.apply_filter_btn = QPushButton("Apply Filter")
+
+        # Coalesce filter edits and clicks into a single reload
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(300)
+        self._filter_timer.timeout.connect(self._emit_filter)
+
         self.apply_filter_btn.clicked.connect(self.on_filter_changed)
-        self.on_filter_changed()  # Initialize filter
+        self.low_filter.textChanged.connect(self.on_filter_changed)
+        self.high_filter.textChanged.connect(self.on_filter_changed)
+        self._emit_filter()  # Initialize filter
 
         # Scale selection
         self.select_scale = QComboBox()
-        for scale in [1, 2, 5, 7, 10, 15, 20, 50, 70, 100, 200, 500, 1000]:
-            self.select_scale.addItem(f'{scale} µV/mm')
-        self.select_scale.currentTextChanged.connect(self.on_scale_changed)
-        self.state.set_scale(int(self.select_scale.currentText().replace(' µV/mm', '')))
+        self.select_scale.addItems([f'{scale} µV/mm' for scale in _SCALES])  # item i is _SCALES[i]
+        self.select_scale.currentIndexChanged.connect(self.on_scale_changed)
+        self.state.set_scale(_SCALES[self.select_scale.currentIndex()])
 
         # Jump navigation controls
         self.jump_label_combo = QComboBox()
@@ -135,35 +161,37 @@ class ControlToolBar(QToolBar):
         # Set initial montage
         self.state.set_montage(self.select_montage.currentText())
 
-        # Layout
-        display_widget = QWidget()
-        display_layout = QHBoxLayout(display_widget)
-        display_layout.addWidget(self.select_montage)
-        display_layout.addWidget(self.open_file)
-        display_layout.addWidget(self.save_btn)
-        display_layout.addWidget(self.spinner_label)
-        display_layout.addWidget(self.x_lim_spinner)
-        display_layout.addWidget(self.goto_input)
-        display_layout.addWidget(self.signal_duration_lbl)
-        display_layout.addWidget(self.sampling_freq_lbl)
-        display_layout.setContentsMargins(0, 0, 0, 0)
-
-        action_widget = QWidget()
-        action_layout = QHBoxLayout(action_widget)
-        action_layout.addWidget(self.undo_btn)
-        action_layout.addWidget(self.label_btn)
-        action_layout.addWidget(self.low_filter)
-        action_layout.addWidget(self.high_filter)
-        action_layout.addWidget(self.apply_filter_btn)
-        action_layout.addWidget(self.select_scale)
-        action_layout.addWidget(self.jump_label_combo)
-        action_layout.addWidget(self.jump_btn)
-        action_layout.setContentsMargins(0, 0, 0, 0)
+        self.state.blockSignals(signals_were_blocked)
+
+        # Layout: two rows in a single container (display controls, then actions)
+        rows = (
+            (
+                self.select_montage,
+                self.open_file,
+                self.save_btn,
+                self.spinner_label,
+                self.x_lim_spinner,
+                self.goto_input,
+                self.signal_duration_lbl,
+                self.sampling_freq_lbl,
+            ),
+            (
+                self.undo_btn,
+                self.label_btn,
+                self.low_filter,
+                self.high_filter,
+                self.apply_filter_btn,
+                self.select_scale,
+                self.jump_label_combo,
+                self.jump_btn,
+            ),
+        )
 
         tools_widget = QWidget()
-        tools_layout = QVBoxLayout(tools_widget)
-        tools_layout.addWidget(display_widget)
-        tools_layout.addWidget(action_widget)
+        tools_layout = QGridLayout(tools_widget)
+        for row, widgets in enumerate(rows):
+            for column, widget in enumerate(widgets):
+                tools_layout.addWidget(widget, row, column)
         tools_layout.setContentsMargins(0, 0, 0, 0)
 
         self.addWidget(tools_widget)
@@ -185,8 +213,13 @@ class ControlToolBar(QToolBar):
         self.x_lim_spinner.setSuffix(" Seconds")
         self.x_lim_spinner.valueChanged.connect(self.on_spinner_value_changed)
 
-        self.signal_duration_lbl.setText(f"Duration: {signal_duration:.1f}s ")
-        self.sampling_freq_lbl.setText(f"Sampling: {s_freq:.0f}Hz")
+        # Only touch the labels when the text changes (avoids a QLabel relayout on reopen)
+        duration_text = f"Duration: {signal_duration:.1f}s "
+        if self.signal_duration_lbl.text() != duration_text:
+            self.signal_duration_lbl.setText(duration_text)
+        sampling_text = f"Sampling: {s_freq:.0f}Hz"
+        if self.sampling_freq_lbl.text() != sampling_text:
+            self.sampling_freq_lbl.setText(sampling_text)
         self.jump_btn.setEnabled(True)
 
     def on_montage_changed(self, new_montage: str):
@@ -211,23 +244,32 @@ class ControlToolBar(QToolBar):
 
     def on_goto_input_return_pressed(self):
         """Handle goto time input."""
-        if self.goto_input.text():
+        try:
             entered_number = int(self.goto_input.text())
-            self.state.goto_input_return_pressed.emit(entered_number)
+        except ValueError:
+            return  # Empty or incomplete input
+        self.state.goto_input_return_pressed.emit(entered_number)
 
     def on_undo_clicked(self):
         """Emit signal to undo last annotation."""
         self.state.undo_clicked.emit()
 
     def on_filter_changed(self):
-        """Handle filter parameter changes."""
-        low = None if self.low_filter.text() == '' else float(self.low_filter.text())
-        high = None if self.high_filter.text() == '' else float(self.high_filter.text())
+        """Handle filter parameter changes (applied once input settles)."""
+        self._filter_timer.start()
+
+    def _emit_filter(self):
+        """Parse filter inputs and publish them to the app state."""
+        try:
+            low = None if self.low_filter.text() == '' else float(self.low_filter.text())
+            high = None if self.high_filter.text() == '' else float(self.high_filter.text())
+        except ValueError:
+            return  # Incomplete input while typing (e.g. "-" or ".")
         self.state.set_filter((low, high))
 
-    def on_scale_changed(self, v: str):
+    def on_scale_changed(self, index: int):
         """Handle scale selection change."""
-        self.state.set_scale(int(v.replace(' µV/mm', '')))
+        self.state.set_scale(_SCALES[index])
 
     def on_jump_label_changed(self, label: str):
         """Emit jump label change signal."""
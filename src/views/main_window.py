@@ -16,9 +16,11 @@
 
 
 from pathlib import Path
+import csv
 import logging
+import os
 
-import pandas as pd
+from PyQt6.QtCore import QObject, QRunnable, QSettings, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QAction, QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
     QApplication,
@@ -37,6 +39,48 @@ from src.models.app_state import AppState
 logger = logging.getLogger(__name__)
 
 
+class _AnnotationLoaderSignals(QObject):
+    """Signals for _AnnotationLoader (QRunnable is not a QObject)."""
+
+    finished = pyqtSignal(object, list)  # (cache key, merged annotation records)
+    failed = pyqtSignal(object, str)     # (cache key, error message)
+
+
+class _AnnotationLoader(QRunnable):
+    """Parse and merge an annotation CSV on the thread pool."""
+
+    def __init__(self, cache_key):
+        super().__init__()
+        self.cache_key = cache_key
+        self.signals = _AnnotationLoaderSignals()
+
+    def run(self):
+        annotation_file_path = self.cache_key[0]
+        try:
+            # Imported here so startup does not pay for pandas until an annotation file is read
+            import pandas as pd
+
+            # Only the columns we merge on; labels are read as text without inference
+            df = pd.read_csv(
+                annotation_file_path,
+                usecols=['channels', 'start_time', 'stop_time', 'onset'],
+                dtype={'channels': str, 'onset': str},
+            )
+
+            # Merge rows with same time/label but different channels (sorted by time/label).
+            # dropna=False: rows with an empty time/label cell are kept, not silently discarded
+            merged_annotations = (
+                df.groupby(['start_time', 'stop_time', 'onset'], sort=True, as_index=False, dropna=False)['channels']
+                .agg(list)
+                .to_dict(orient="records")
+            )
+        except Exception as e:
+            self.signals.failed.emit(self.cache_key, str(e))
+            return
+
+        self.signals.finished.emit(self.cache_key, merged_annotations)
+
+
 class EEGAnnotator(QMainWindow):
     """Main window for Ziyatron EEG annotation application.
 
@@ -52,12 +96,12 @@ class EEGAnnotator(QMainWindow):
         self.setWindowTitle("Ziyatron EEG Annotator v2.0")
         self.resize(1400, 800)
 
-        self.filename = None  # Set by open_file(); guards on_settings_changed / on_scale_changed
+        self.filename: Path | None = None  # Set by open_file(); guards on_settings_changed / on_scale_changed
 
         # Application state
         self.state = AppState()
-        self.state.montage_changed.connect(self.on_settings_changed)
-        self.state.filter_changed.connect(self.on_settings_changed)
+        self.state.montage_changed.connect(self.on_montage_changed)
+        self.state.filter_changed.connect(self.on_filter_changed)
         self.state.scale_changed.connect(self.on_scale_changed)
 
         # Create UI components
@@ -104,23 +148,36 @@ class EEGAnnotator(QMainWindow):
         self.setCentralWidget(widget)
 
         # State variables
-        self.filename: Path = None
+        self._last_load_key = None  # (filename, montage, filter) of the data currently shown
+        self._annotation_cache = None  # ((csv path, mtime_ns), merged annotation records)
+        self._pending_annotation_key = None  # Cache key of the load in flight; other results are stale
 
     def open_file(self):
         """Open EDF file dialog and load file."""
         file_filters = "EDF Files (*.edf *.EDF)"
 
-        filename, _ = QFileDialog.getOpenFileName(
-            self,
-            "Open EDF File",
-            "",
-            file_filters
+        # Start in the directory of the last opened file
+        settings = QSettings("Ziyatron", "EEGAnnotator")
+        start_dir = settings.value("last_edf_dir", "", type=str)
+
+        # Qt's own dialog with icon/symlink lookups off: the native one can take
+        # seconds to initialize on network mounts and large directories
+        dialog = QFileDialog(self, "Open EDF File", start_dir)
+        dialog.setNameFilter(file_filters)
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.setOptions(
+            QFileDialog.Option.DontUseNativeDialog
+            | QFileDialog.Option.DontResolveSymlinks
+            | QFileDialog.Option.DontUseCustomDirectoryIcons
         )
 
-        if not filename:
+        if not dialog.exec():
             return
 
+        filename = dialog.selectedFiles()[0]
+
         self.filename = Path(filename)
+        settings.setValue("last_edf_dir", str(self.filename.parent))
 
         try:
             # Load EDF file with current montage and filter settings
@@ -142,6 +199,7 @@ class EEGAnnotator(QMainWindow):
             self.control_toolbar.save_btn.setEnabled(True)
             self.control_toolbar.show_controls(signal_duration, s_freq)
 
+            self._last_load_key = self._load_key()
             logger.info(f"Loaded file: {self.filename}")
 
         except Exception as e:
@@ -153,62 +211,67 @@ class EEGAnnotator(QMainWindow):
             )
 
     def load_annotations(self):
-        """Load existing annotations from CSV file if it exists."""
+        """Load existing annotations from CSV file if it exists.
+
+        The CSV is parsed on the thread pool; the plot is updated when it finishes.
+        """
+        # Any load still in flight is for a previous file/montage
+        self._pending_annotation_key = None
+
         if not self.filename:
             return
 
+        # Whatever is shown belongs to the previous file/montage
+        self.eeg_plot_widget.render_annotations([])
+
         work_dir = self.filename.parent
         eeg_file_name = self.filename.stem
-        annotation_file_path = work_dir / f"{eeg_file_name}_{self.state.montage_name.replace(' ', '_')}.csv"
+        annotation_file_path = work_dir / f"{eeg_file_name}_{self.state.montage_slug}.csv"
 
         if not annotation_file_path.exists():
             logger.info("No existing annotations found")
             return
 
-        try:
-            df = pd.read_csv(annotation_file_path)
-            annotations = df.to_dict(orient="records")
-
-            # Sort annotations
-            annotations.sort(key=lambda a: (a['start_time'], a['stop_time'], a['onset']))
-
-            # Merge annotations with same time/label but different channels
-            merged_annotations = []
-            if len(annotations) > 0:
-                current_annotation = {
-                    'channels': [annotations[0]['channels']],
-                    'start_time': annotations[0]['start_time'],
-                    'stop_time': annotations[0]['stop_time'],
-                    'onset': annotations[0]['onset']
-                }
-
-                for i in range(1, len(annotations)):
-                    ann = annotations[i]
-                    if (current_annotation['start_time'] == ann['start_time'] and
-                        current_annotation['stop_time'] == ann['stop_time'] and
-                        current_annotation['onset'] == ann['onset']):
-                        current_annotation['channels'].append(ann['channels'])
-                    else:
-                        merged_annotations.append(current_annotation)
-                        current_annotation = {
-                            'channels': [ann['channels']],
-                            'start_time': ann['start_time'],
-                            'stop_time': ann['stop_time'],
-                            'onset': ann['onset']
-                        }
-
-                merged_annotations.append(current_annotation)
-
-            self.eeg_plot_widget.load_annotations(merged_annotations)
-            logger.info(f"Loaded {len(merged_annotations)} annotations from {annotation_file_path}")
+        # Reuse the parsed file while it is unchanged on disk (e.g. switching montages back)
+        cache_key = (annotation_file_path, annotation_file_path.stat().st_mtime_ns)
+        if self._annotation_cache is not None and self._annotation_cache[0] == cache_key:
+            self.eeg_plot_widget.load_annotations(self._copy_annotations(self._annotation_cache[1]))
+            logger.info(f"Loaded {len(self._annotation_cache[1])} cached annotations for {annotation_file_path}")
+            return
 
-        except Exception as e:
-            logger.error(f"Failed to load annotations: {e}")
-            QMessageBox.warning(
-                self,
-                "Warning",
-                f"Failed to load existing annotations:\n{e}"
-            )
+        loader = _AnnotationLoader(cache_key)
+        loader.signals.finished.connect(self._on_annotations_loaded)
+        loader.signals.failed.connect(self._on_annotations_failed)
+        self._pending_annotation_key = cache_key
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_annotations_loaded(self, cache_key, merged_annotations: list):
+        """Show annotations parsed by _AnnotationLoader unless they are stale."""
+        if cache_key != self._pending_annotation_key:
+            return
+        self._pending_annotation_key = None
+
+        self._annotation_cache = (cache_key, merged_annotations)
+        self.eeg_plot_widget.load_annotations(self._copy_annotations(merged_annotations))
+        logger.info(f"Loaded {len(merged_annotations)} annotations from {cache_key[0]}")
+
+    def _on_annotations_failed(self, cache_key, error: str):
+        """Report a failed annotation load unless it is stale."""
+        if cache_key != self._pending_annotation_key:
+            return
+        self._pending_annotation_key = None
+
+        logger.error(f"Failed to load annotations: {error}")
+        QMessageBox.warning(
+            self,
+            "Warning",
+            f"Failed to load existing annotations:\n{error}"
+        )
+
+    @staticmethod
+    def _copy_annotations(annotations):
+        """Copy annotation records so plot edits do not leak into the parsed-file cache."""
+        return [dict(annotation, channels=list(annotation["channels"])) for annotation in annotations]
 
     def save_annotations(self):
         """Save annotations to CSV file."""
@@ -224,22 +287,16 @@ class EEGAnnotator(QMainWindow):
 
         work_dir = self.filename.parent
         eeg_file_name = self.filename.stem
-        annotation_file_path = work_dir / f"{eeg_file_name}_{self.state.montage_name.replace(' ', '_')}.csv"
+        annotation_file_path = work_dir / f"{eeg_file_name}_{self.state.montage_slug}.csv"
 
         try:
-            # Expand annotations (one row per channel)
-            csv_rows = []
-            for annotation in annotations:
-                for channel in annotation['channels']:
-                    csv_rows.append({
-                        'channels': channel,
-                        'start_time': annotation['start_time'],
-                        'stop_time': annotation['stop_time'],
-                        'onset': annotation['onset'],
-                    })
-
-            df = pd.DataFrame(csv_rows, columns=["channels", "start_time", "stop_time", "onset"])
-            df.to_csv(annotation_file_path, index=False)
+            # Expand annotations (one row per channel); same layout as DataFrame.to_csv
+            with open(annotation_file_path, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file, lineterminator=os.linesep)
+                writer.writerow(["channels", "start_time", "stop_time", "onset"])
+                for annotation in annotations:
+                    for channel in annotation["channels"]:
+                        writer.writerow((channel, annotation["start_time"], annotation["stop_time"], annotation["onset"]))
 
             logger.info(f"Saved {len(annotations)} annotations to {annotation_file_path}")
             QMessageBox.information(
@@ -256,11 +313,31 @@ class EEGAnnotator(QMainWindow):
                 f"Failed to save annotations:\n{e}"
             )
 
-    def on_settings_changed(self):
-        """Reload EEG data when montage or filter changes."""
+    def on_montage_changed(self):
+        """Reload EEG data and the montage's annotation file."""
+        self.on_settings_changed(reload_annotations=True)
+
+    def on_filter_changed(self):
+        """Reload EEG data, keeping the annotations currently on the plot."""
+        self.on_settings_changed(reload_annotations=False)
+
+    def on_settings_changed(self, reload_annotations: bool = True):
+        """Reload EEG data when montage or filter changes.
+
+        No-op when the file, montage and filter match what is already shown.
+
+        Args:
+            reload_annotations: Read annotations from the montage's CSV; otherwise
+                re-render the current ones (including unsaved edits)
+        """
         if not self.filename:
             return
 
+        # Signals can fire without an effective change (e.g. toggling back before a reload)
+        load_key = self._load_key()
+        if load_key == self._last_load_key:
+            return
+
         try:
             # Preserve current time position before reload resets the view
             saved_range = None
@@ -282,12 +359,18 @@ class EEGAnnotator(QMainWindow):
                 start_time, duration = saved_range
                 self.eeg_plot_widget._set_x_range_and_update(start_time, start_time + duration)
 
-            # Reload annotations
-            self.load_annotations()
+            # Annotation files are per montage; a filter change keeps the current ones
+            if reload_annotations:
+                self.load_annotations()
+            else:
+                self.eeg_plot_widget.render_annotations()
 
+            self._last_load_key = load_key
             logger.info(f"Reloaded with montage={self.state.montage_name}, filter={self.state.filter}")
 
         except Exception as e:
+            # The view is now half-reloaded: any later setting, including the previous one, must reload
+            self._last_load_key = None
             logger.error(f"Failed to reload with new settings: {e}")
             QMessageBox.critical(
                 self,
@@ -295,6 +378,10 @@ class EEGAnnotator(QMainWindow):
                 f"Failed to apply new settings:\n{e}"
             )
 
+    def _load_key(self):
+        """Identify the file/montage/filter combination currently requested."""
+        return (self.filename, self.state.montage_name, self.state.filter)
+
     def on_scale_changed(self):
         """Update scale factor when scale changes."""
         if not self.filename:
@@ -303,12 +390,13 @@ class EEGAnnotator(QMainWindow):
         scale_uv_per_mm = self.state.scale
 
         # Use plot widget's method to update scale properly
-        # This updates scale_factor, Y-axis labels, Y-axis range, and reloads plot
+        # This updates scale_factor, Y-axis labels, Y-axis range, and re-plots the loaded window
         self.eeg_plot_widget.set_scale_factor(scale_uv_per_mm)
 
     def closeEvent(self, event):
         """Handle window close event."""
         if self.eeg_plot_widget.data_streamer:
+            self.eeg_plot_widget.cancel_window_loads()
             self.eeg_plot_widget.data_streamer.close()
 
         logger.info("Application closed")
@@ -15,11 +15,14 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 
-import bisect
-from typing import List, Dict, Optional, Tuple
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, List, Dict, Optional, Tuple
 
+import numpy as np
 import pyqtgraph as pg
-from PyQt6.QtCore import Qt, QRectF, QPointF
+from PyQt6.QtCore import Qt, QObject, QRectF, QPointF, QRunnable, QThreadPool, QTimer
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -27,6 +30,7 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QComboBox,
     QLabel,
+    QGraphicsItem,
     QGraphicsRectItem,
 )
 from PyQt6.QtGui import QKeyEvent, QCursor
@@ -34,10 +38,23 @@ from PyQt6.QtGui import QKeyEvent, QCursor
 from src.core.config import config
 from src.core.data_streamer import EEGDataStreamer
 
+logger = logging.getLogger(__name__)
+
+# Label -> position in config.diagnosis (first occurrence for duplicates, as list.index)
+_DIAG_IDX: Dict[str, int] = {name: i for i, name in reversed(list(enumerate(config.diagnosis)))}
+
 
 class AnnotationROI(pg.ROI):
     sigSelected = pg.QtCore.Signal(object)  # emits self when left-clicked
 
+    # (handle position, scale center) pairs: corners, then top/bottom, then right/left edges
+    _SCALE_HANDLES = (
+        ([1, 1], [0, 0]), ([0, 0], [1, 1]),
+        ([0, 1], [1, 0]), ([1, 0], [0, 1]),
+        ([0.5, 1], [0.5, 0]), ([0.5, 0], [0.5, 1]),
+        ([1, 0.5], [0, 0.5]), ([0, 0.5], [1, 0.5]),
+    )
+
     def __init__(self, pos, size, data: Dict, **kwargs):
         pg.ROI.__init__(
             self,
@@ -51,17 +68,8 @@ class AnnotationROI(pg.ROI):
             **kwargs
         )
 
-        self.addScaleHandle([1, 1], [0, 0])
-        self.addScaleHandle([0, 0], [1, 1])
-
-        self.addScaleHandle([0, 1], [1, 0])
-        self.addScaleHandle([1, 0], [0, 1])
-
-        self.addScaleHandle([0.5, 1], [0.5, 0])
-        self.addScaleHandle([0.5, 0], [0.5, 1])
-
-        self.addScaleHandle([1, 0.5], [0, 0.5])
-        self.addScaleHandle([0, 0.5], [1, 0.5])
+        # Scale handles are added on first hover: most annotations are never resized
+        self._has_handles = False
 
         self._is_hovered = False
         self._is_selected = False
@@ -69,6 +77,8 @@ class AnnotationROI(pg.ROI):
         self._selected_pen = pg.mkPen(color=(255, 165, 0), width=4)  # orange border when selected
 
         self.data = data
+        self._label_idx = _DIAG_IDX.get(data["onset"], 0)  # Preselected entry in the label dialog
+        self.get_label_dialog: Optional[Callable[[], LabelDialog]] = None  # Set by the owning EEGPlotWidget
         self.text_item = pg.TextItem(
             text=self.data["onset"],
             color='b',
@@ -86,8 +96,18 @@ class AnnotationROI(pg.ROI):
         self._is_selected = selected
         self.setPen(self._selected_pen if selected else self._normal_pen)
 
+    def _add_scale_handles(self):
+        """Create the resize handles (once)."""
+        if self._has_handles:
+            return
+        self._has_handles = True
+        for pos, center in self._SCALE_HANDLES:
+            self.addScaleHandle(pos, center)
+
     def hoverEvent(self, ev):
         self._is_hovered = not ev.isExit()
+        if self._is_hovered:
+            self._add_scale_handles()
         super().hoverEvent(ev)
 
     def _on_clicked(self, _roi, ev):
@@ -96,22 +116,16 @@ class AnnotationROI(pg.ROI):
             ev.accept()
             return
         if ev.button() == pg.QtCore.Qt.MouseButton.RightButton:
-            label_dialog = LabelDialog()
-            try:
-                current_label_idx = config.diagnosis.index(self.text_item.textItem.toPlainText())
-                label_dialog.label_idx = current_label_idx
-                combobox = label_dialog.findChild(QComboBox)
-                if combobox:
-                    combobox.setCurrentIndex(current_label_idx)
-            except ValueError:
-                pass
+            label_dialog = self.get_label_dialog()
+            label_dialog.reset(self._label_idx)
 
             label_dialog.exec()
 
             if label_dialog.delete_requested:
                 self.sigRemoveRequested.emit(self)
             elif label_dialog.result():
-                new_label = config.diagnosis[label_dialog.label_idx]
+                self._label_idx = label_dialog.label_idx
+                new_label = config.diagnosis[self._label_idx]
                 self.data["onset"] = new_label
                 self.text_item.setText(new_label, 'b')
 
@@ -121,8 +135,8 @@ class AnnotationROI(pg.ROI):
 class LabelDialog(QDialog):
     """Dialog for selecting annotation label from predefined diagnosis options."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.setWindowTitle("Label Selection")
         self.label_idx = 0
         self.delete_requested = False
@@ -130,9 +144,9 @@ class LabelDialog(QDialog):
         layout = QVBoxLayout()
 
         # Label dropdown with diagnosis options from config
-        label_combobox = QComboBox()
-        label_combobox.addItems(config.diagnosis)
-        label_combobox.currentIndexChanged.connect(self._on_index_changed)
+        self.label_combobox = QComboBox()
+        self.label_combobox.addItems(config.diagnosis)
+        self.label_combobox.currentIndexChanged.connect(self._on_index_changed)
 
         ok_btn = QPushButton("Ok")
         ok_btn.clicked.connect(self.accept)
@@ -141,12 +155,18 @@ class LabelDialog(QDialog):
         delete_btn.clicked.connect(self._on_delete)
 
         layout.addWidget(QLabel("Select Diagnosis Label:"))
-        layout.addWidget(label_combobox)
+        layout.addWidget(self.label_combobox)
         layout.addWidget(ok_btn)
         layout.addWidget(delete_btn)
 
         self.setLayout(layout)
 
+    def reset(self, label_idx: int):
+        """Prepare the dialog for another annotation, preselecting label_idx."""
+        self.delete_requested = False
+        self.label_idx = label_idx
+        self.label_combobox.setCurrentIndex(label_idx)
+
     def _on_index_changed(self, i: int):
         """Update selected label index."""
         self.label_idx = i
@@ -156,14 +176,83 @@ class LabelDialog(QDialog):
         self.delete_requested = True
         self.reject()
 
+
+class _WindowLoaderSignals(QObject):
+    """Signals for _WindowLoader (QRunnable is not a QObject)."""
+
+    finished = pg.QtCore.Signal(int, object)  # (request sequence number, window Raw)
+    failed = pg.QtCore.Signal(int, str)       # (request sequence number, error message)
+
+
+class _WindowLoader(QRunnable):
+    """Read, re-reference and filter a window off the GUI thread."""
+
+    def __init__(self, seq: int, data_streamer: EEGDataStreamer, start_time: float, duration: float,
+                 montage_name: str, filter_params: Tuple):
+        super().__init__()
+        self.seq = seq
+        self.data_streamer = data_streamer
+        self.request = (start_time, duration, montage_name, filter_params)
+        self.signals = _WindowLoaderSignals()
+
+    def run(self):
+        start_time, duration, montage_name, filter_params = self.request
+        try:
+            # Neighbours are prefetched from the GUI thread once this window is shown
+            window_data = self.data_streamer.get_window(
+                start_time=start_time,
+                duration=duration,
+                montage_name=montage_name,
+                filter_params=filter_params,
+                prefetch=False
+            )
+        except Exception as e:
+            self.signals.failed.emit(self.seq, str(e))
+            return
+        self.signals.finished.emit(self.seq, window_data)
+
+
+class MultiLine(pg.QtWidgets.QGraphicsPathItem):
+    """All channel traces drawn as a single path item.
+
+    One QPainterPath with a break between channels replaces one PlotDataItem per
+    channel, so a redraw is one paint call regardless of the channel count.
+    """
+
+    def __init__(self, pen):
+        super().__init__()
+        self.setPen(pen)
+        self._connect: Optional[np.ndarray] = None  # Reused while the data shape stays the same
+
+    def setData(self, x: np.ndarray, y: np.ndarray):
+        """Set the traces.
+
+        Args:
+            x: Sample times, shape (n_samples,)
+            y: Channel values, shape (n_channels, n_samples)
+        """
+        if self._connect is None or self._connect.shape != y.shape:
+            self._connect = np.ones(y.shape, dtype=bool)
+            self._connect[:, -1] = False  # Do not join the end of a channel to the next one
+        xs = np.broadcast_to(x, y.shape)
+        self.setPath(pg.arrayToQPath(xs.ravel(), y.ravel(), self._connect.ravel()))
+
+    def shape(self):
+        # QGraphicsPathItem.shape() strokes the whole path for hit testing; traces are not interactive
+        return QGraphicsItem.shape(self)
+
+    def boundingRect(self):
+        return self.path().boundingRect()
+
+
 class EEGPlotWidget(QWidget):
     """Memory-efficient EEG plot widget using PyQtGraph.
 
     Key improvements over Matplotlib:
     - 10-100x faster rendering for time-series data
-    - Automatic downsampling when zoomed out
-    - Only renders visible viewport (clipToView)
-    - GPU-accelerated with OpenGL (optional)
+    - Automatic downsampling to the view's pixel width
+    - All channels drawn as a single path item (MultiLine)
+    - GPU-accelerated with OpenGL (optional, config.use_opengl)
     - Smooth pan/zoom without full redraws
 
     Integrates with EEGDataStreamer for lazy loading of data windows.
@@ -175,6 +264,12 @@ class EEGPlotWidget(QWidget):
         self.state = state
         self.data_streamer = EEGDataStreamer()
 
+        # Cache misses are loaded on a single worker thread; only the latest request is shown
+        self._window_pool = QThreadPool(self)
+        self._window_pool.setMaxThreadCount(1)
+        self._window_seq = 0  # Bumped per update_plot so older results are discarded
+        self._window_request: Optional[Tuple] = None  # (start, duration, montage, filter) of the latest request
+
         # Plot configuration
         self._scale_constant = 0.00001
         self.scale_factor = self._scale_constant  # Vertical spacing between channels
@@ -184,15 +279,21 @@ class EEGPlotWidget(QWidget):
         self.signal_duration = 0
         self.window_duration = 10  # Initial display window in seconds
 
-        # Annotation data
-        self.annotation_items: List[AnnotationROI] = []
+        # Annotation data (creation order). ROIs are only materialized for the
+        # annotations near the visible time range, keyed by id() of their data dict.
+        self._annotation_data: List[Dict] = []
+        self._visible_rois: Dict[int, AnnotationROI] = {}
         self.selected_annotation_roi = None  # Currently selected annotation for highlighting
+        self._label_dialog: Optional[LabelDialog] = None  # Shared by all ROIs, see _get_label_dialog
         self._clipboard_annotation = None    # Copied annotation data dict
         self._last_mouse_view_pos = None     # Cursor position in view coords (QPointF)
 
         # Jump navigation state
-        self._sorted_annotations: list = []  # list of (start_time, AnnotationROI), sorted
-        self._jump_cursor = None              # last AnnotationROI jumped to
+        # Columnar index over _annotation_data, sorted by start time
+        self._index_data: List[Dict] = []
+        self._index_starts = np.empty(0)
+        self._index_stops = np.empty(0)
+        self._jump_cursor = None              # data dict of the last annotation jumped to
         self._jump_label: str = "ALL"
 
         # Drawing mode state
@@ -201,9 +302,6 @@ class EEGPlotWidget(QWidget):
         self._draw_start_pos = None  # QPointF in view coordinates
         self._preview_rect = None  # QGraphicsRectItem for temporary preview
 
-        # Flag to prevent signal cascading during programmatic range changes
-        self._updating_range = False
-
         # Setup PyQtGraph widget
         self.setup_plot_widget()
 
@@ -226,6 +324,13 @@ class EEGPlotWidget(QWidget):
         """Initialize PyQtGraph PlotWidget with optimized settings."""
         self.plot_widget = pg.PlotWidget()
 
+        # Must happen before the viewport gets its event filter: useOpenGL replaces the viewport
+        if config.use_opengl:
+            try:
+                self.plot_widget.useOpenGL(True)
+            except Exception as e:
+                logger.warning(f"OpenGL unavailable, using software rendering: {e}")
+
         # Configure plot appearance
         self.plot_widget.setBackground('w')  # White background
         self.plot_widget.showGrid(x=True, y=False, alpha=0.3)
@@ -241,26 +346,70 @@ class EEGPlotWidget(QWidget):
         # Enable keyboard focus for arrow key navigation
         self.plot_widget.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
-        # Connect view range change signal for lazy loading
+        # Connect view range change signal for lazy loading (coalesced while the user drags)
+        self._range_debounce = QTimer(self)
+        self._range_debounce.setSingleShot(True)
+        self._range_debounce.setInterval(40)
+        self._range_debounce.timeout.connect(self._do_range_reload)
         self.plot_widget.sigRangeChanged.connect(self.on_view_range_changed)
 
+        # Downsampling depends on the view's pixel width
+        self.plot_widget.getViewBox().sigResized.connect(lambda _: self._redraw_signal())
+
         # Install event filter for keyboard shortcuts and drawing
         self.plot_widget.installEventFilter(self)
         self.plot_widget.viewport().installEventFilter(self)
 
         # Plot items storage
-        self.channel_curves = []
+        self.signal_item: Optional[MultiLine] = None  # All channel traces
+        self._plot_buffer: Optional[np.ndarray] = None  # float32 offset signal handed to the curves
+        self._y_offsets: Optional[np.ndarray] = None  # (n_channels, 1) channel baselines
+        self._bulk_depth = 0  # Nesting level of _bulk_update blocks
+        self._y_ticks_key: Optional[Tuple] = None  # (scale_factor, channel names) the axis ticks were built for
+        self._plot_bounds: Optional[QRectF] = None  # Shared annotation maxBounds, see _update_plot_bounds
+        self._window_signal: Optional[np.ndarray] = None  # Last fetched window (no offsets applied)
+        self._window_time_axis: Optional[np.ndarray] = None
+        self._time_ramp: Optional[np.ndarray] = None  # Sample offsets in seconds (index * period)
+        self._time_buffer: Optional[np.ndarray] = None  # Reused storage for the window's time axis
         self._channel_index: dict[str, int] = {}
 
+    @contextmanager
+    def _bulk_update(self):
+        """Suspend repaints and ViewBox signals while many plot items are added or removed.
+
+        Range changes must happen outside this block so the axes follow them.
+        Blocks may nest; only the outermost one restores repaints and signals.
+        """
+        self._bulk_depth += 1
+        if self._bulk_depth > 1:
+            try:
+                yield
+            finally:
+                self._bulk_depth -= 1
+            return
+
+        view_box = self.plot_widget.getViewBox()
+        view_box.blockSignals(True)
+        self.plot_widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            self.plot_widget.setUpdatesEnabled(True)
+            view_box.blockSignals(False)
+            view_box.update()
+
     def _channel_y(self, channel_index: int) -> float:
         """Convert channel index to inverted Y position (first channel at top)."""
         return (len(self.montage_list) - 1 - channel_index) * self.scale_factor
 
-    def _y_to_channel_range(self, y_low: float, y_high: float) -> tuple[int, int]:
-        """Convert Y coordinate range to (first_ch, last_ch) indices (inverted)."""
-        n = len(self.montage_list)
-        first_ch = max(0, n - 1 - int(y_high / self.scale_factor))
-        last_ch = min(n - 1, n - 1 - int(y_low / self.scale_factor))
+    def _y_to_channel_range(self, y0: float, y1: float) -> tuple[int, int]:
+        """Convert a Y coordinate span (either order) to (first_ch, last_ch) indices (inverted)."""
+        if y0 > y1:
+            y0, y1 = y1, y0
+        last = len(self.montage_list) - 1
+        first_ch = max(0, last - int(y1 / self.scale_factor))
+        last_ch = min(last, last - int(y0 / self.scale_factor))
         return first_ch, last_ch
 
     def load_edf_file(self, filename: str, montage_name: str, filter_params: Tuple):
@@ -271,12 +420,18 @@ class EEGPlotWidget(QWidget):
             montage: Montage type (e.g., 'AVERAGE', 'BIPOLAR DOUBLE BANANA')
             filter_params: Tuple of (low_freq, high_freq)
         """
-        self.data_streamer.open_edf(filename)
+        # Finish with the old handle before it is replaced
+        self.cancel_window_loads()
+
+        # Settings changes reload the same file: keep its handle and cached raw windows
+        if self.data_streamer.raw_handle is None or self.data_streamer.filename != Path(filename):
+            self.data_streamer.open_edf(filename)
         self.current_montage = montage_name
         self.current_filter = filter_params
 
         metadata = self.data_streamer.get_metadata()
         self.signal_duration = metadata['duration']
+        self._time_ramp = None  # Sampling rate may differ from the previous file
 
         # Load initial window to get channel information
         initial_window = self.data_streamer.get_window(
@@ -302,23 +457,25 @@ class EEGPlotWidget(QWidget):
         Args:
             n_channels: Number of channels to display
         """
-        self.plot_widget.clear()
-        self.channel_curves = []
-
-        # Create one PlotDataItem per channel with optimization flags
-        for i in range(n_channels):
-            curve = self.plot_widget.plot(
-                pen=pg.mkPen(color='k', width=1),
-                downsample=10,  # Auto-downsample when zoomed out
-                autoDownsampleFactor=5.0,  # Adjust detail by zoom level
-                clipToView=True,  # Only render visible region (CRITICAL)
-            )
-            self.channel_curves.append(curve)
+        self._update_y_offsets(n_channels)
+        self._update_plot_bounds()
+
+        # One path item for every channel (downsampled to the view width in _redraw_signal)
+        with self._bulk_update():
+            # Annotation items live on the ViewBox, which PlotItem.clear() does not touch;
+            # their data is kept for render_annotations
+            self._deselect_all()
+            for annotation_roi in list(self._visible_rois.values()):
+                self._detach_annotation_roi(annotation_roi)
+            self.plot_widget.clear()
+            self.signal_item = MultiLine(pg.mkPen(color='k', width=1))
+            # Keep the rendered traces as a pixmap: annotation edits repaint only their
+            # region and reuse it instead of re-stroking the signal (redrawn on pan/zoom/data)
+            self.signal_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+            self.plot_widget.addItem(self.signal_item)
 
         # Set Y-axis ticks to show channel names
-        y_ticks = [(self._channel_y(i), name) for i, name in enumerate(self.montage_list)]
-        y_axis = self.plot_widget.getAxis('left')
-        y_axis.setTicks([y_ticks])
+        self._update_y_ticks()
 
         # Set initial view range
         self.plot_widget.setXRange(0, self.window_duration, padding=0)
@@ -328,34 +485,150 @@ class EEGPlotWidget(QWidget):
         """Update plot with new time window from data streamer.
 
         This is where lazy loading happens - only loads visible window.
+        Cached windows are drawn immediately; others are loaded on a worker
+        thread and drawn when ready (see _on_window_loaded).
 
         Args:
             start_time: Start time in seconds
             duration: Window duration in seconds
         """
-        # Load window from data streamer (lazy loading)
-        window_data = self.data_streamer.get_window(
-            start_time=start_time,
-            duration=duration,
-            montage_name=self.current_montage,
-            filter_params=self.current_filter
+        self._window_seq += 1
+        self._window_request = (start_time, duration, self.current_montage, self.current_filter)
+
+        # Cached windows are shown immediately
+        if self.data_streamer.has_window(*self._window_request):
+            window_data = self.data_streamer.get_window(
+                start_time=start_time,
+                duration=duration,
+                montage_name=self.current_montage,
+                filter_params=self.current_filter,
+                prefetch_step=config.pan_ammount
+            )
+            self._show_window(window_data)
+            return
+
+        # Otherwise read/filter on the worker while the GUI keeps handling input;
+        # a newer request supersedes any load that has not started yet
+        loader = _WindowLoader(self._window_seq, self.data_streamer, *self._window_request)
+        loader.signals.finished.connect(self._on_window_loaded)
+        loader.signals.failed.connect(self._on_window_failed)
+        self._window_pool.clear()
+        self._window_pool.start(loader)
+
+    def cancel_window_loads(self):
+        """Drop queued window loads and wait for the one in progress (before closing/replacing the file)."""
+        self._window_seq += 1
+        self._window_pool.clear()
+        self._window_pool.waitForDone()
+
+    def _on_window_loaded(self, seq: int, window_data):
+        """Show a window loaded by _WindowLoader unless a newer one was requested."""
+        if seq != self._window_seq:
+            return
+        self._show_window(window_data)
+
+        start_time, duration, montage_name, filter_params = self._window_request
+        self.data_streamer.prefetch_around(
+            start_time, duration, montage_name, filter_params, prefetch_step=config.pan_ammount
         )
 
+    def _on_window_failed(self, seq: int, error: str):
+        """Report a failed window load unless it is stale."""
+        if seq != self._window_seq:
+            return
+        logger.error(f"Failed to load window: {error}")
+
+    def _show_window(self, window_data):
+        """Plot a loaded window (MNE Raw whose first_time is the window start)."""
         signal = window_data.get_data()
-        time_axis = window_data.times + start_time
 
-        # Update each channel's curve efficiently
-        for i, curve in enumerate(self.channel_curves):
-            curve.setData(time_axis, signal[i] + self._channel_y(i))
+        self._window_signal = signal
+        self._window_time_axis = self._time_axis(signal.shape[1], window_data.info['sfreq'], window_data.first_time)
+        self._redraw_signal()
 
-    def on_view_range_changed(self, _):
-        """Called when user pans/zooms - triggers lazy loading of new window.
+    def _time_axis(self, n_samples: int, sfreq: float, first_time: float) -> np.ndarray:
+        """Return the window's sample times, written into a buffer reused across pans.
 
-        This is the key integration point with the data streamer.
+        The per-sample offsets are computed once per file (and whenever the window
+        grows), so each update is a single add with no allocation. Kept in float64:
+        float32 cannot resolve sample spacing hours into a recording.
+        """
+        if self._time_ramp is None or len(self._time_ramp) < n_samples:
+            self._time_ramp = np.arange(n_samples, dtype=np.float64) * (1.0 / sfreq)
+            self._time_buffer = np.empty(n_samples, dtype=np.float64)
+        time_axis = self._time_buffer[:n_samples]
+        np.add(self._time_ramp[:n_samples], first_time, out=time_axis)
+        return time_axis
+
+    def _redraw_signal(self):
+        """Re-plot the current window at the current scale without refetching it.
+
+        Scale changes only move the channel baselines, so they go through here
+        instead of update_plot and never touch the data streamer.
+        """
+        if self._window_signal is None or self.signal_item is None:
+            return
+
+        signal = self._window_signal
+        time_axis = self._window_time_axis
+
+        # float32 is plenty for display and halves the bytes PyQtGraph has to walk;
+        # the buffer is reused across updates while the window shape stays the same
+        if self._plot_buffer is None or self._plot_buffer.shape != signal.shape:
+            self._plot_buffer = np.empty(signal.shape, dtype=np.float32)
+
+        # Offset all channels in one broadcast add against the cached baselines
+        np.add(signal, self._y_offsets, out=self._plot_buffer, dtype=np.float32, casting='same_kind')
+
+        # Zoomed out past a few samples per pixel column: keep only each column's
+        # min and max (an envelope that still shows spikes), otherwise plot every sample
+        n_channels, n_samples = signal.shape
+        view_width = max(1, int(self.plot_widget.getViewBox().width()))
+        bin_size = n_samples // view_width
+        if bin_size >= 4:
+            n_bins = n_samples // bin_size
+            used = n_bins * bin_size
+            bins = self._plot_buffer[:, :used].reshape(n_channels, n_bins, bin_size)
+            envelope = np.empty((n_channels, n_bins, 2), dtype=np.float32)
+            np.min(bins, axis=2, out=envelope[:, :, 0])
+            np.max(bins, axis=2, out=envelope[:, :, 1])
+            x = np.repeat(time_axis[:used:bin_size], 2)
+            self.signal_item.setData(x, envelope.reshape(n_channels, 2 * n_bins))
+        else:
+            self.signal_item.setData(time_axis, self._plot_buffer)
+
+    def _update_y_ticks(self):
+        """Label channel baselines on the Y axis (skipped if scale and channels are unchanged).
+
+        Filter changes and repeated scale selections reload with the same ticks,
+        so the axis is not asked to regenerate its labels.
         """
-        if self._updating_range:
+        key = (self.scale_factor, tuple(self.montage_list))
+        if key == self._y_ticks_key:
             return
+        self._y_ticks_key = key
+
+        y_ticks = [(self._channel_y(i), name) for i, name in enumerate(self.montage_list)]
+        self.plot_widget.getAxis('left').setTicks([y_ticks])
+
+    def _update_y_offsets(self, n_channels: int):
+        """Cache the channel baselines as a float32 column (first channel at top)."""
+        offsets = np.arange(n_channels - 1, -1, -1) * self.scale_factor
+        self._y_offsets = offsets.astype(np.float32)[:, np.newaxis]
+
+    def on_view_range_changed(self, _):
+        """Called when user pans/zooms - schedules lazy loading of the new window.
+
+        Bursts of range changes (mouse drags) are coalesced: the window is loaded
+        once the range has been still for the debounce interval.
+        """
+        self._range_debounce.start()
+
+    def _do_range_reload(self):
+        """Load the window for the current view range.
 
+        This is the key integration point with the data streamer.
+        """
         view_range = self.plot_widget.viewRange()
         x_min, x_max = view_range[0]
 
@@ -365,6 +638,8 @@ class EEGPlotWidget(QWidget):
         if duration <= 0:
             return
 
+        self._sync_visible_annotations()
+
         # Only reload if view has actually changed significantly
         # (avoid redundant loads during minor adjustments)
         if hasattr(self, '_last_view_range'):
@@ -441,14 +716,19 @@ class EEGPlotWidget(QWidget):
 
     def _set_x_range_and_update(self, x_min: float, x_max: float):
         """Set X range without triggering on_view_range_changed, then update plot directly."""
-        self._updating_range = True
-        self.plot_widget.setXRange(x_min, x_max, padding=0)
-        self._updating_range = False
+        self._range_debounce.stop()  # This update supersedes any pending drag reload
+        # Detach only our slot: blocking the ViewBox would also stop the axes following the range
+        self.plot_widget.sigRangeChanged.disconnect(self.on_view_range_changed)
+        try:
+            self.plot_widget.setXRange(x_min, x_max, padding=0)
+        finally:
+            self.plot_widget.sigRangeChanged.connect(self.on_view_range_changed)
 
         start_time = max(0, x_min)
         duration = x_max - x_min
         self._last_view_range = (start_time, duration)
         self.update_plot(start_time, duration)
+        self._sync_visible_annotations()
 
     def pan_left(self):
         """Pan view to the left by configured amount."""
@@ -480,6 +760,9 @@ class EEGPlotWidget(QWidget):
         """
         self.window_duration = duration
 
+        # Queued neighbours were sized for the old duration
+        self.data_streamer.cancel_prefetch()
+
         view_range = self.plot_widget.viewRange()
         x_min = view_range[0][0]
 
@@ -494,6 +777,15 @@ class EEGPlotWidget(QWidget):
         time = min(self.signal_duration - self.window_duration, time)
         time = max(0, time)
 
+        # Already showing this window (e.g. Enter pressed again): nothing to redraw.
+        # Checked against the view itself: _last_view_range is not updated by sub-0.5 s drags
+        x_min, x_max = self.plot_widget.viewRange()[0]
+        if abs(x_min - time) < 1e-3 and abs((x_max - x_min) - self.window_duration) < 1e-3:
+            return
+
+        # Neighbours of the old position are no longer useful
+        self.data_streamer.cancel_prefetch()
+
         self._set_x_range_and_update(time, time + self.window_duration)
 
     def enable_selection_mode(self):
@@ -614,9 +906,7 @@ class EEGPlotWidget(QWidget):
 
         x_start = rect.left()
         x_end = rect.right()
-        first_ch, last_ch = self._y_to_channel_range(
-            min(rect.top(), rect.bottom()), max(rect.top(), rect.bottom())
-        )
+        first_ch, last_ch = self._y_to_channel_range(rect.top(), rect.bottom())
         selected_channels = self.montage_list[first_ch:last_ch + 1]
 
         if len(selected_channels) == 0:
@@ -647,18 +937,71 @@ class EEGPlotWidget(QWidget):
         return True
 
     def _get_plot_bounds(self) -> QRectF:
-        """Get the plot boundaries as a QRectF for constraining annotation movement."""
+        """Get the plot boundaries as a QRectF for constraining annotation movement.
+
+        The same instance is shared by every annotation; treat it as read-only.
+        """
+        if self._plot_bounds is None:
+            self._update_plot_bounds()
+        return self._plot_bounds
+
+    def _update_plot_bounds(self):
+        """Recompute the cached plot boundaries (channels, scale or duration changed)."""
         n_channels = len(self.montage_list)
         y_min = -self.scale_factor
         y_height = (n_channels - 1) * self.scale_factor + 2 * self.scale_factor
-        return QRectF(0, y_min, self.signal_duration, y_height)
+        self._plot_bounds = QRectF(0, y_min, self.signal_duration, y_height)
 
     def _create_editable_annotation_rect(self, annotation_roi: AnnotationROI) -> AnnotationROI:
-        """Create an editable annotation rectangle with event handlers."""
+        """Add a newly drawn/pasted annotation and its editable rectangle."""
+        self._annotation_data.append(annotation_roi.data)
+        self._attach_annotation_roi(annotation_roi)
+        self._rebuild_jump_index()
+
+        return annotation_roi
+
+    def _get_label_dialog(self) -> LabelDialog:
+        """Return the label dialog shared by this widget's annotations, building it on first use.
+
+        Parented to the widget so it is destroyed with it rather than at interpreter exit.
+        """
+        if self._label_dialog is None:
+            self._label_dialog = LabelDialog(self)
+        return self._label_dialog
+
+    def _build_annotation_roi(self, annotation_data: Dict) -> Optional[AnnotationROI]:
+        """Build the rectangle for an annotation, or None if its channels are not in the montage."""
+        if len(annotation_data["channels"]) == 0:
+            return None
+
+        first_ch_idx = self._channel_index.get(annotation_data["channels"][0])
+        last_ch_idx = self._channel_index.get(annotation_data["channels"][-1])
+        if first_ch_idx is None or last_ch_idx is None:
+            return None
+
+        y_first = self._channel_y(first_ch_idx)
+        y_last = self._channel_y(last_ch_idx)
+        y_min = min(y_first, y_last)
+        y_max = max(y_first, y_last)
+
+        x_start = annotation_data["start_time"]
+        x_end = annotation_data["stop_time"]
+
+        return AnnotationROI(
+            pos=[x_start, y_min],
+            size=[x_end - x_start, y_max - y_min],
+            data=annotation_data,
+        )
+
+    def _attach_annotation_roi(self, annotation_roi: AnnotationROI):
+        """Connect an annotation rectangle's handlers and add it to the plot."""
 
         # Restrict movement to plot boundaries
         annotation_roi.maxBounds = self._get_plot_bounds()
 
+        # Right-click reuses this widget's label dialog
+        annotation_roi.get_label_dialog = self._get_label_dialog
+
         # Connect signals for data synchronization
         annotation_roi.sigRegionChangeFinished.connect(lambda: self._on_annotation_moved(annotation_roi))
         annotation_roi.sigRemoveRequested.connect(lambda: self._delete_annotation(annotation_roi))
@@ -667,13 +1010,53 @@ class EEGPlotWidget(QWidget):
         # Connect region changed signal to update text position during drag
         annotation_roi.sigRegionChanged.connect(lambda: self._update_annotation_text_position(annotation_roi))
 
-        self.plot_widget.addItem(annotation_roi)
-        self.plot_widget.addItem(annotation_roi.text_item)
+        # Straight onto the ViewBox, outside auto-range: annotations never define the
+        # data bounds, so there is no childrenBounds recomputation per item
+        view_box = self.plot_widget.getViewBox()
+        view_box.addItem(annotation_roi, ignoreBounds=True)
+        view_box.addItem(annotation_roi.text_item, ignoreBounds=True)
+
+        self._visible_rois[id(annotation_roi.data)] = annotation_roi
 
-        self.annotation_items.append(annotation_roi)
-        self._rebuild_jump_index()
+    def _detach_annotation_roi(self, annotation_roi: AnnotationROI):
+        """Disconnect an annotation rectangle and remove it from the plot (data is kept)."""
+        annotation_roi.sigRegionChangeFinished.disconnect()
+        annotation_roi.sigRemoveRequested.disconnect()
+        annotation_roi.sigRegionChanged.disconnect()
+        annotation_roi.sigSelected.disconnect()
 
-        return annotation_roi
+        view_box = self.plot_widget.getViewBox()
+        view_box.removeItem(annotation_roi.text_item)
+        view_box.removeItem(annotation_roi)
+
+        self._visible_rois.pop(id(annotation_roi.data), None)
+
+        if self.selected_annotation_roi is annotation_roi:
+            self.selected_annotation_roi = None
+
+    def _sync_visible_annotations(self):
+        """Materialize rectangles for annotations near the view and drop the rest.
+
+        One window of margin on either side keeps short pans from popping
+        rectangles in and out.
+        """
+        x_min, x_max = self.plot_widget.viewRange()[0]
+        margin = x_max - x_min
+        wanted = {id(self._index_data[i]): self._index_data[i]
+                  for i in self.visible_indices(x_min - margin, x_max + margin)}
+
+        stale = [roi for key, roi in self._visible_rois.items() if key not in wanted]
+        missing = [data for key, data in wanted.items() if key not in self._visible_rois]
+        if not stale and not missing:
+            return
+
+        with self._bulk_update():
+            for annotation_roi in stale:
+                self._detach_annotation_roi(annotation_roi)
+            for annotation_data in missing:
+                annotation_roi = self._build_annotation_roi(annotation_data)
+                if annotation_roi is not None:
+                    self._attach_annotation_roi(annotation_roi)
 
     def _update_annotation_text_position(self, annotation_roi: AnnotationROI):
         """Update text position when annotation is moved."""
@@ -702,7 +1085,7 @@ class EEGPlotWidget(QWidget):
         y_start = pos[1]
         y_end = pos[1] + size[1]
 
-        first_ch, last_ch = self._y_to_channel_range(min(y_start, y_end), max(y_start, y_end))
+        first_ch, last_ch = self._y_to_channel_range(y_start, y_end)
         selected_channels = self.montage_list[first_ch:last_ch + 1]
 
         # Update annotation data in-place
@@ -720,36 +1103,25 @@ class EEGPlotWidget(QWidget):
         if not annotation_roi:
             return
 
-        # Disconnect signals before removal
-        annotation_roi.sigRegionChangeFinished.disconnect()
-        annotation_roi.sigRemoveRequested.disconnect()
-        annotation_roi.sigRegionChanged.disconnect()
-        annotation_roi.sigSelected.disconnect()
-
         # Remove from visual items (both rect and text)
-        self.plot_widget.removeItem(annotation_roi.text_item)
-        self.plot_widget.removeItem(annotation_roi)
-
-        # Remove from annotation_items list
-        if annotation_roi in self.annotation_items:
-            self.annotation_items.remove(annotation_roi)
+        self._detach_annotation_roi(annotation_roi)
 
-        # Clear selection if deleted annotation was selected
-        if self.selected_annotation_roi is annotation_roi:
-            self.selected_annotation_roi = None
+        # Remove from annotation data (by identity: dicts may compare equal)
+        annotation_data = annotation_roi.data
+        self._annotation_data = [d for d in self._annotation_data if d is not annotation_data]
 
         # Reset jump cursor if deleted annotation was the cursor
-        if self._jump_cursor is annotation_roi:
+        if self._jump_cursor is annotation_data:
             self._jump_cursor = None
         self._rebuild_jump_index()
 
         # Disable undo button if no more annotations
-        if len(self.annotation_items) == 0 and self.state:
+        if len(self._annotation_data) == 0 and self.state:
             self.state.enable_undo_button.emit(False)
 
     def _delete_hovered_annotation(self):
         """Delete the annotation currently under the mouse cursor."""
-        for roi in self.annotation_items:
+        for roi in self._visible_rois.values():
             if roi._is_hovered:
                 self._delete_annotation(roi)
                 return
@@ -800,15 +1172,13 @@ class EEGPlotWidget(QWidget):
         data["stop_time"] = new_end
 
         # Validate channels exist in current montage
-        valid_channels = [c for c in data["channels"] if c in self.montage_list]
+        valid_channels = [c for c in data["channels"] if c in self._channel_index]
         if not valid_channels:
             return
         data["channels"] = valid_channels
 
-        first_idx = self._channel_index.get(valid_channels[0])
-        last_idx = self._channel_index.get(valid_channels[-1])
-        if first_idx is None or last_idx is None:
-            return
+        first_idx = self._channel_index[valid_channels[0]]
+        last_idx = self._channel_index[valid_channels[-1]]
 
         y_first = self._channel_y(first_idx)
         y_last = self._channel_y(last_idx)
@@ -827,114 +1197,94 @@ class EEGPlotWidget(QWidget):
 
     def render_annotations(self, annotations: Optional[List[Dict]] = None):
         """Render all saved annotations on the plot as EDITABLE rectangles."""
-        # Clear existing annotation items
-        self._deselect_all()
-        for annotation_roi in self.annotation_items:
-            annotation_roi.sigRegionChangeFinished.disconnect()
-            annotation_roi.sigRemoveRequested.disconnect()
-            annotation_roi.sigRegionChanged.disconnect()
-            annotation_roi.sigSelected.disconnect()
-            self.plot_widget.removeItem(annotation_roi.text_item)
-            self.plot_widget.removeItem(annotation_roi)
-
-        if annotations is None:
-            annotations = [annotation_roi.data for annotation_roi in self.annotation_items]
-        self.annotation_items.clear()
-
-        # Re-render all annotations as editable
-        for annotation_data in annotations:
-            if len(annotation_data["channels"]) == 0:
-                continue
-
-            first_ch_idx = self._channel_index.get(annotation_data["channels"][0])
-            last_ch_idx = self._channel_index.get(annotation_data["channels"][-1])
-            if first_ch_idx is None or last_ch_idx is None:
-                # Channel not in current montage, skip
-                continue
-
-            y_first = self._channel_y(first_ch_idx)
-            y_last = self._channel_y(last_ch_idx)
-            y_min = min(y_first, y_last)
-            y_max = max(y_first, y_last)
-
-            x_start = annotation_data["start_time"]
-            x_end = annotation_data["stop_time"]
-
-            annotation_roi = AnnotationROI(
-                pos=[x_start, y_min],
-                size=[x_end - x_start, y_max - y_min],
-                data=annotation_data,
-            )
-            self._create_editable_annotation_rect(annotation_roi)
+        # One repaint for the whole batch instead of one per added/removed item
+        with self._bulk_update():
+            # Clear existing annotation items
+            self._deselect_all()
+            for annotation_roi in list(self._visible_rois.values()):
+                self._detach_annotation_roi(annotation_roi)
+
+            if annotations is None:
+                annotations = self._annotation_data
+
+            # Keep annotations whose channels exist in the current montage;
+            # rectangles are only built for the ones near the view
+            self._annotation_data = [
+                annotation_data for annotation_data in annotations
+                if len(annotation_data["channels"]) > 0
+                and annotation_data["channels"][0] in self._channel_index
+                and annotation_data["channels"][-1] in self._channel_index
+            ]
+            self._rebuild_jump_index()
+            self._sync_visible_annotations()
 
         self._jump_cursor = None
 
     def undo_annotation(self):
         """Remove the last annotation."""
-        if len(self.annotation_items) == 0:
+        if len(self._annotation_data) == 0:
             if self.state:
                 self.state.enable_undo_button.emit(False)
             return
 
-        # Remove last annotation
-        annotation_roi = self.annotation_items.pop()
-
-        # Disconnect signals before removal
-        annotation_roi.sigRegionChangeFinished.disconnect()
-        annotation_roi.sigRemoveRequested.disconnect()
-        annotation_roi.sigRegionChanged.disconnect()
-        annotation_roi.sigSelected.disconnect()
-
-        self.plot_widget.removeItem(annotation_roi.text_item)
-        self.plot_widget.removeItem(annotation_roi)
-
-        # Clear selection if deleted annotation was selected
-        if self.selected_annotation_roi is annotation_roi:
-            self.selected_annotation_roi = None
+        # Remove last annotation (and its rectangle, if materialized)
+        annotation_data = self._annotation_data.pop()
+        annotation_roi = self._visible_rois.get(id(annotation_data))
+        if annotation_roi is not None:
+            self._detach_annotation_roi(annotation_roi)
 
         # Reset jump cursor if undone annotation was the cursor
-        if self._jump_cursor is annotation_roi:
+        if self._jump_cursor is annotation_data:
             self._jump_cursor = None
         self._rebuild_jump_index()
 
         # Disable undo button if no more annotations
-        if len(self.annotation_items) == 0 and self.state:
+        if len(self._annotation_data) == 0 and self.state:
             self.state.enable_undo_button.emit(False)
 
     def _rebuild_jump_index(self):
-        """Rebuild the sorted annotation index used for jump navigation."""
-        self._sorted_annotations = sorted(
-            ((roi.data["start_time"], roi) for roi in self.annotation_items),
-            key=lambda t: t[0]
-        )
+        """Rebuild the sorted, columnar annotation index used for range queries and jumps."""
+        n = len(self._annotation_data)
+        starts = np.fromiter((d["start_time"] for d in self._annotation_data), dtype=np.float64, count=n)
+        order = np.argsort(starts, kind='stable')
 
-    def _filtered_sorted_annotations(self, label: str) -> list:
-        """Return sorted annotations filtered by label ('ALL' returns all)."""
+        self._index_data = [self._annotation_data[i] for i in order]
+        self._index_starts = starts[order]
+        self._index_stops = np.fromiter((d["stop_time"] for d in self._index_data), dtype=np.float64, count=n)
+
+    def _filtered_index(self, label: str) -> np.ndarray:
+        """Return positions into the sorted index matching label ('ALL' returns all)."""
         if label == "ALL":
-            return self._sorted_annotations
-        return [(t, roi) for t, roi in self._sorted_annotations if roi.data["onset"] == label]
+            return np.arange(len(self._index_data))
+        # Labels can be edited in place on the ROI, so read them live
+        return np.flatnonzero([d["onset"] == label for d in self._index_data])
+
+    def visible_indices(self, tmin: float, tmax: float) -> np.ndarray:
+        """Return positions into the sorted index of annotations intersecting [tmin, tmax]."""
+        end = np.searchsorted(self._index_starts, tmax, side='right')
+        return np.flatnonzero(self._index_stops[:end] >= tmin)
 
-    def _jump_to_annotation(self, roi: "AnnotationROI"):
-        self._jump_cursor = roi
-        self.goto_time(roi.data["start_time"])
+    def _jump_to_annotation(self, annotation_data: Dict):
+        self._jump_cursor = annotation_data
+        self.goto_time(annotation_data["start_time"])
 
     def jump_to_nearest(self, label: str):
         """Jump to the annotation nearest to the current view center."""
-        candidates = self._filtered_sorted_annotations(label)
-        if not candidates:
+        candidates = self._filtered_index(label)
+        if len(candidates) == 0:
             return
         view_range = self.plot_widget.viewRange()
         view_center = sum(view_range[0]) / 2.0
-        starts = [t for t, _ in candidates]
-        idx = bisect.bisect_left(starts, view_center)
-        best_roi, best_dist = None, float('inf')
+        starts = self._index_starts[candidates]
+        idx = int(np.searchsorted(starts, view_center, side='left'))
+        best, best_dist = None, float('inf')
         for i in (idx - 1, idx):
             if 0 <= i < len(candidates):
-                dist = abs(candidates[i][0] - view_center)
+                dist = abs(starts[i] - view_center)
                 if dist < best_dist:
-                    best_dist, best_roi = dist, candidates[i][1]
-        if best_roi:
-            self._jump_to_annotation(best_roi)
+                    best_dist, best = dist, self._index_data[candidates[i]]
+        if best is not None:
+            self._jump_to_annotation(best)
 
     def jump_to_next(self, label: str):
         self._jump_in_direction(label, forward=True)
@@ -943,22 +1293,22 @@ class EEGPlotWidget(QWidget):
         self._jump_in_direction(label, forward=False)
 
     def _jump_in_direction(self, label: str, forward: bool):
-        candidates = self._filtered_sorted_annotations(label)
-        if not candidates:
+        candidates = self._filtered_index(label)
+        if len(candidates) == 0:
             return
         if self._jump_cursor is None:
             self.jump_to_nearest(label)
             return
-        starts = [t for t, _ in candidates]
-        cur_start = self._jump_cursor.data["start_time"]
+        starts = self._index_starts[candidates]
+        cur_start = self._jump_cursor["start_time"]
         if forward:
-            idx = bisect.bisect_right(starts, cur_start)
+            idx = int(np.searchsorted(starts, cur_start, side='right'))
             if idx < len(candidates):
-                self._jump_to_annotation(candidates[idx][1])
+                self._jump_to_annotation(self._index_data[candidates[idx]])
         else:
-            idx = bisect.bisect_left(starts, cur_start) - 1
+            idx = int(np.searchsorted(starts, cur_start, side='left')) - 1
             if idx >= 0:
-                self._jump_to_annotation(candidates[idx][1])
+                self._jump_to_annotation(self._index_data[candidates[idx]])
 
     def _on_jump_label_changed(self, label: str):
         """Update the active jump label filter."""
@@ -980,9 +1330,7 @@ class EEGPlotWidget(QWidget):
         n_channels = len(self.montage_list)
 
         # Update Y-axis ticks with new scale factor
-        y_ticks = [(self._channel_y(i), name) for i, name in enumerate(self.montage_list)]
-        y_axis = self.plot_widget.getAxis('left')
-        y_axis.setTicks([y_ticks])
+        self._update_y_ticks()
 
         # Update Y-axis range to fit all channels with new scale
         self.plot_widget.setYRange(
@@ -995,25 +1343,40 @@ class EEGPlotWidget(QWidget):
         """Update scale factor and refresh plot.
 
         This is the proper way to change the scale - it updates the scale factor,
-        adjusts Y-axis labels to match, and reloads the plot.
+        adjusts Y-axis labels to match, and re-plots the loaded window.
 
         Args:
             scale_uv_per_mm: Scale in µV/mm (e.g., 1, 10, 100, 1000)
         """
         # Convert µV/mm to vertical spacing factor
         # The factor 0.0004 is empirical - adjust if channels are too close/far
+        old_scale_factor = self.scale_factor
         self.scale_factor = scale_uv_per_mm * self._scale_constant
+        self._update_y_offsets(len(self.montage_list))
+        self._update_plot_bounds()
 
         # Update Y-axis labels and range to match new scale
         self.update_y_axis()
 
-        # Reload current view with new scale
-        view_range = self.plot_widget.viewRange()
-        x_min, x_max = view_range[0]
-        self.update_plot(x_min, x_max - x_min)
-
-        # Re-render annotations so their Y positions match the new scale
-        self.render_annotations()
+        # Re-offset the already loaded window (data itself is unchanged)
+        self._redraw_signal()
+
+        # Channel positions scale linearly, so existing annotations only need stretching
+        self._rescale_annotations(self.scale_factor / old_scale_factor)
+
+    def _rescale_annotations(self, ratio: float):
+        """Scale annotation Y position/extent in place after a scale factor change."""
+        with self._bulk_update():
+            for annotation_roi in self._visible_rois.values():
+                pos = annotation_roi.pos()
+                size = annotation_roi.size()
+                annotation_roi.maxBounds = self._get_plot_bounds()
+                # Geometry only: channels/times are unchanged, so skip _on_annotation_moved
+                annotation_roi.blockSignals(True)
+                annotation_roi.setPos((pos[0], pos[1] * ratio))
+                annotation_roi.setSize((size[0], size[1] * ratio))
+                annotation_roi.blockSignals(False)
+                self._update_annotation_text_position(annotation_roi)
 
     def get_annotations(self) -> List[Dict]:
         """Get all annotations for saving to CSV.
@@ -1021,7 +1384,7 @@ class EEGPlotWidget(QWidget):
         Returns:
             List of annotation dictionaries
         """
-        return [annotation_roi.data for annotation_roi in self.annotation_items]
+        return list(self._annotation_data)
 
     def load_annotations(self, annotations: List[Dict]):
         """Load annotations from CSV file.
@@ -1031,5 +1394,5 @@ class EEGPlotWidget(QWidget):
         """
         self.render_annotations(annotations)
 
-        if len(self.annotation_items) > 0 and self.state:
+        if len(self._annotation_data) > 0 and self.state:
             self.state.enable_undo_button.emit(True)